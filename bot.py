@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord.ext import commands
 import os
@@ -5,14 +6,15 @@ from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
-import json
 
 from src.scripts_soloq import (
+    json_loads,
     count_soloq,
     get_current_elo,
     format_players_report,
     build_player_rows,
     build_players_embed,
+    create_riot_session,
     hydrate_players_accounts,
 )
 
@@ -28,40 +30,75 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 paris_tz = pytz.timezone("Europe/Paris")
 scheduler = AsyncIOScheduler(timezone=paris_tz)
 
+# Report channel, resolved once (on_ready, or the first use after a failed lookup)
+REPORT_CHANNEL = None
 
-async def send_daily_message():
-    channel_id = int(os.getenv("CHANNEL_ID", "0"))
-    channel = bot.get_channel(channel_id)
+# Env config; parsed once in on_ready since env vars don't change at runtime
+_PLAYERS = None
+_API_KEY = None
 
-    # Load players JSON from env var 'players_json' (must be valid JSON string)
+
+def load_players_config():
+    """Parse players JSON from env var 'players_json' (must be valid JSON string)."""
     players_json_text = os.getenv("players_json")
     if not players_json_text:
         print("players_json env var not set")
-        return
+        return None
     try:
-        players_json = json.loads(players_json_text)
+        return json_loads(players_json_text)
     except Exception as e:
         print("Invalid players_json:", e)
-        return
+        return None
+
+
+async def resolve_report_channel():
+    """Return the CHANNEL_ID channel from the cache, falling back to one REST fetch."""
+    channel_id = int(os.getenv("CHANNEL_ID", "0"))
+    channel = bot.get_channel(channel_id)
+    if channel is None and channel_id:
+        try:
+            channel = await bot.fetch_channel(channel_id)
+        except discord.DiscordException as e:
+            print(f"Could not fetch channel {channel_id}:", e)
+    return channel
 
 
-    global_api_key = os.getenv("prod_api_key")
+async def get_report_channel():
+    """Return the cached report channel, retrying the lookup while it is still unresolved."""
+    global REPORT_CHANNEL
+    if REPORT_CHANNEL is None:
+        REPORT_CHANNEL = await resolve_report_channel()
+    return REPORT_CHANNEL
 
 
-    rows = build_player_rows(players_json, global_api_key=global_api_key)
+async def send_daily_message():
+    channel = await get_report_channel()
+    players_json = _PLAYERS
+    if players_json is None:
+        return
+    global_api_key = _API_KEY
 
-    # Build ASCII table message
-    msg = format_players_report(rows)
+    # One pooled session for the whole run: Riot calls are fanned out concurrently.
+    async with create_riot_session(global_api_key) as session:
+        rows = await build_player_rows(session, players_json, global_api_key=global_api_key)
+
+    # Build ASCII table message (CPU work, keep it off the event loop)
+    msg = await asyncio.to_thread(format_players_report, rows)
 
     if channel:
         await channel.send(f"```{msg}```")
     else:
-        print(f"Channel with ID {channel_id} not found.")
+        print(f"Channel with ID {os.getenv('CHANNEL_ID')} not found.")
 
 
 @bot.event
 async def on_ready():
+    global _PLAYERS, _API_KEY
     print(f"{bot.user} has connected to Discord!")
+    if _PLAYERS is None:
+        _PLAYERS = load_players_config()
+        _API_KEY = os.getenv("prod_api_key")
+    await get_report_channel()
     # Start the scheduler only once — run daily at 11:00 Europe/Paris
     if not scheduler.running:
         scheduler.add_job(send_daily_message, CronTrigger(hour=11, minute=0))
@@ -71,8 +108,7 @@ async def on_ready():
 @bot.command(name="send")
 async def send_message(ctx, *, message):
     """Send a message to a specific channel"""
-    channel_id = int(os.getenv("CHANNEL_ID", "0"))
-    channel = bot.get_channel(channel_id)
+    channel = await get_report_channel()
     if channel:
         await channel.send(message)
         await ctx.send(f"Message sent to {channel.mention}")
@@ -80,9 +116,14 @@ async def send_message(ctx, *, message):
         await ctx.send("Channel not found.")
 
 
-# Run the bot
-TOKEN = os.getenv("DISCORD_TOKEN")
-if TOKEN:
-    bot.run(TOKEN)
-else:
-    print("DISCORD_TOKEN not found in .env file")
+def run_bot():
+    """Start the Discord client (blocking). Importing this module does not connect."""
+    token = os.getenv("DISCORD_TOKEN")
+    if token:
+        bot.run(token)
+    else:
+        print("DISCORD_TOKEN not found in .env file")
+
+
+if __name__ == "__main__":
+    run_bot()
@@ -3,7 +3,7 @@ Railway / host entrypoint.
 
 Run with: `python main.py` (Railway start command)
 
-This file loads `.env` locally (ignored by git) and imports `bot` which starts the
+This file loads `.env` locally (ignored by git) and calls `bot.run_bot()` which starts the
 Discord client. Keep secrets in environment variables on the host (Railway secrets).
 """
 from dotenv import load_dotenv
@@ -13,8 +13,9 @@ def main():
     # Load local .env for development only
     load_dotenv()
 
-    # Importing `bot` will execute the module-level startup (bot.run)
-    import bot  # noqa: F401
+    from bot import run_bot
+
+    run_bot()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,28 @@
+import asyncio
 import os
+import random
+import tempfile
 import time
-import requests
+import weakref
+import aiohttp
+from collections import deque
 from urllib.parse import quote
 import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Default players/accounts (used when no env var or file provided)
 
@@ -20,7 +37,7 @@ def load_players_accounts_from_env() -> dict[str, list[dict[str, str | None]]]:
     json_text = os.getenv("PLAYERS_ACCOUNTS_JSON")
     if json_text:
         try:
-            return json.loads(json_text)
+            return json_loads(json_text)
         except Exception as e:
             raise ValueError("Invalid JSON in PLAYERS_ACCOUNTS_JSON") from e
 
@@ -30,16 +47,144 @@ def load_players_accounts_from_env() -> dict[str, list[dict[str, str | None]]]:
         if not p.exists():
             raise FileNotFoundError(f"PLAYERS_ACCOUNTS_FILE not found: {file_path}")
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            return json_loads(p.read_bytes())
         except Exception as e:
             raise ValueError(f"Invalid JSON in file {file_path}") from e
 
     return DEFAULT_PLAYERS_ACCOUNTS
 
 
-def get_ids(
+# Riot development key limits: 20 requests / 1 s and 100 requests / 2 min.
+# Only the default: production keys set `RIOT_RATE_LIMITS` (see `riot_rate_limits_from_env`).
+RIOT_RATE_LIMITS: tuple[tuple[int, float], ...] = ((20, 1.0), (100, 120.0))
+
+
+def riot_rate_limits_from_env() -> tuple[tuple[int, float], ...]:
+    """Return rate limits from the `RIOT_RATE_LIMITS` env var, else the dev-key defaults.
+
+    Format matches Riot's `X-App-Rate-Limit` header: "requests:seconds" pairs,
+    comma separated, e.g. "500:10,30000:600".
+    """
+    text = os.getenv("RIOT_RATE_LIMITS")
+    if not text:
+        return RIOT_RATE_LIMITS
+    try:
+        limits = tuple(
+            (int(count), float(window))
+            for count, window in (part.split(":") for part in text.split(",") if part.strip())
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid RIOT_RATE_LIMITS: {text!r}") from e
+    # a zero/negative count or window would break RiotLimiter's sliding windows
+    if not limits or any(count <= 0 or window <= 0 for count, window in limits):
+        raise ValueError(f"Invalid RIOT_RATE_LIMITS: {text!r}")
+    return limits
+
+
+class RiotLimiter:
+    """Concurrency cap plus sliding-window rate limit shared by all Riot API calls.
+
+    Use `async with limiter:` around each request. `pause()` (called on a 429)
+    holds back every caller, so accounts share one backoff instead of each
+    discovering the limit on its own.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        limits: tuple[tuple[int, float], ...] | None = None,
+    ) -> None:
+        if limits is None:
+            limits = riot_rate_limits_from_env()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limits = limits
+        self._calls: deque[float] = deque(maxlen=max(limit for limit, _ in limits))
+        self._resume_at = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all new requests for at least `seconds`."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def _wait_for_window(self) -> None:
+        while True:
+            now = time.monotonic()
+            wait = self._resume_at - now
+            for limit, window in self._limits:
+                if len(self._calls) >= limit:
+                    wait = max(wait, self._calls[-limit] + window - now)
+            if wait <= 0:
+                self._calls.append(now)
+                return
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self) -> "RiotLimiter":
+        await self._semaphore.acquire()
+        try:
+            await self._wait_for_window()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._semaphore.release()
+
+
+_RIOT_LIMITER: RiotLimiter | None = None
+
+
+def _default_riot_limiter() -> RiotLimiter:
+    # Built on first use, so `RIOT_RATE_LIMITS` from a later `load_dotenv()` is honoured.
+    global _RIOT_LIMITER
+    if _RIOT_LIMITER is None:
+        _RIOT_LIMITER = RiotLimiter()
+    return _RIOT_LIMITER
+
+
+# Limiters attached by `create_riot_session`; other sessions use the module-wide one.
+_SESSION_LIMITERS: "weakref.WeakKeyDictionary[aiohttp.ClientSession, RiotLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _riot_limiter_for(session: aiohttp.ClientSession) -> RiotLimiter:
+    return _SESSION_LIMITERS.get(session) or _default_riot_limiter()
+
+
+def create_riot_session(
+    api_key: str | None = None,
+    limits: tuple[tuple[int, float], ...] | None = None,
+    max_concurrency: int = 20,
+) -> aiohttp.ClientSession:
+    """Return the keep-alive session every Riot helper in this module expects.
+
+    One pooled session per run reuses TCP/TLS connections across all calls.
+    The session gets its own `RiotLimiter(max_concurrency, limits)` that every
+    helper called with it shares; `limits=None` means `riot_rate_limits_from_env()`.
+    Close it when done (`async with create_riot_session(key) as session: ...`).
+    """
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=max_concurrency, keepalive_timeout=30)
+    headers = {"X-Riot-Token": api_key} if api_key else None
+    session = aiohttp.ClientSession(headers=headers, connector=connector)
+    _SESSION_LIMITERS[session] = RiotLimiter(max_concurrency=max_concurrency, limits=limits)
+    return session
+
+
+def _retry_after_s(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait after a 429: Riot's `Retry-After` header, else exponential."""
+    retry_after = resp.headers.get("Retry-After")
+    return float(retry_after) if retry_after else min(2 ** attempt, 60)
+
+
+def _jittered(sleep_s: float) -> float:
+    # Up to +25% so accounts rate-limited together don't all retry at the same instant.
+    return sleep_s + random.uniform(0, sleep_s * 0.25)
+
+
+async def get_ids(
+    session: aiohttp.ClientSession,
     game_name: str,
-    api_key: str,
+    api_key: str | None = None,
     tag_line: str | None = None,
     region: str = "europe",
     retries: int = 10,
@@ -66,35 +211,35 @@ def get_ids(
         f"{game_name_enc}/{tag_line_enc}"
     )
 
-    headers = {"X-Riot-Token": api_key}
+    headers = {"X-Riot-Token": api_key} if api_key else None
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    limiter = _riot_limiter_for(session)
 
     last_exc = None
     for attempt in range(1, retries + 1):
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
-
-            if resp.status_code == 200:
-                return resp.json()
-
-            if resp.status_code == 429:
-                retry_after = resp.headers.get("Retry-After")
-                sleep_s = float(retry_after) if retry_after else min(2 ** attempt, 60)
-                time.sleep(sleep_s)
-                continue
-
-            if resp.status_code in (500, 502, 503, 504):
-                time.sleep(min(backoff ** attempt, 30))
-                continue
-
-            try:
-                details = resp.json()
-            except ValueError:
-                details = resp.text
-            raise RuntimeError(f"Riot API error {resp.status_code}: {details}")
-
-        except (requests.Timeout, requests.ConnectionError) as exc:
+            # Sleep outside the `async with` so the pooled connection is released while waiting.
+            async with limiter, session.get(url, headers=headers, timeout=client_timeout) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+
+                if resp.status == 429:
+                    sleep_s = _retry_after_s(resp, attempt)
+                    limiter.pause(sleep_s)
+                elif resp.status in (500, 502, 503, 504):
+                    sleep_s = min(backoff ** attempt, 30)
+                else:
+                    try:
+                        details = await resp.json(content_type=None)
+                    except ValueError:
+                        details = await resp.text()
+                    raise RuntimeError(f"Riot API error {resp.status}: {details}")
+
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exc:
             last_exc = exc
-            time.sleep(min(backoff ** attempt, 30))
+            sleep_s = min(backoff ** attempt, 30)
+
+        await asyncio.sleep(_jittered(sleep_s))
 
     raise RuntimeError(f"Failed after {retries} attempts") from last_exc
 
@@ -103,19 +248,39 @@ def _load_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except Exception:
         return {}
 
 
 def _save_json(path: Path, data: dict[str, Any]) -> None:
+    """Write `data` to `path` atomically (per-call temp file + `os.replace`).
+
+    Each writer gets its own temp file, so concurrent saves never share a
+    partially written file; the last `os.replace` wins.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
-def hydrate_players_accounts(
+async def hydrate_players_accounts(
+    session: aiohttp.ClientSession,
     players_accounts: dict[str, list[dict[str, str]]],
-    api_key: str,
+    api_key: str | None = None,
     region: str = "europe",
     include_puuid: bool = True,
     cache_path: str | None = "data/riot_account_cache.json",
@@ -126,25 +291,54 @@ def hydrate_players_accounts(
     - Nothing sensitive (API key) is ever written to disk.
     - If `cache_path` is set, results are cached to avoid extra API calls.
     - If `include_puuid=False`, the returned dict omits PUUIDs (sets them to None).
+    - Cache misses are resolved concurrently on `session`; `get_ids` retries 429s
+      using `Retry-After`. If any lookup fails, the successful ones are still
+      cached before the first error is raised.
     """
     hydrated: dict[str, list[dict[str, str | None]]] = {}
     cache_file = Path(cache_path) if cache_path else None
-    cache: dict[str, Any] = _load_json(cache_file) if cache_file else {}
+    cache: dict[str, Any] = await asyncio.to_thread(_load_json, cache_file) if cache_file else {}
+
+    def _cache_key(account_name: str) -> str:
+        # Cache key includes region because account routing is regional (americas/europe/asia).
+        return f"{region}:{account_name}"
 
+    # Collect every cache miss first, then resolve them all in one concurrent batch.
+    misses: list[str] = []
     for player, accounts in players_accounts.items():
-        hydrated[player] = []
         for account in accounts:
             account_name = account.get("account_name")
             if not account_name:
                 raise ValueError(f"Missing account_name for player {player}")
+            ids = cache.get(_cache_key(account_name))
+            if (not isinstance(ids, dict) or not ids.get("puuid")) and account_name not in misses:
+                misses.append(account_name)
+
+    results = await asyncio.gather(
+        *(
+            get_ids(session, game_name=name, tag_line=None, api_key=api_key, region=region)
+            for name in misses
+        ),
+        return_exceptions=True,
+    )
+    errors: list[BaseException] = []
+    for name, ids in zip(misses, results):
+        if isinstance(ids, BaseException):
+            errors.append(ids)
+        else:
+            cache[_cache_key(name)] = ids
+
+    if errors:
+        # Keep whatever did resolve so a retry only re-fetches the failures.
+        if cache_file:
+            await asyncio.to_thread(_save_json, cache_file, cache)
+        raise errors[0]
 
-            # Cache key includes region because account routing is regional (americas/europe/asia).
-            cache_key = f"{region}:{account_name}"
-            ids = cache.get(cache_key)
-            if not isinstance(ids, dict) or not ids.get("puuid"):
-                ids = get_ids(game_name=account_name, tag_line=None, api_key=api_key, region=region)
-                cache[cache_key] = ids
-
+    for player, accounts in players_accounts.items():
+        hydrated[player] = []
+        for account in accounts:
+            account_name = account["account_name"]
+            ids = cache[_cache_key(account_name)]
             hydrated[player].append(
                 {
                     "account_name": account_name,
@@ -155,68 +349,146 @@ def hydrate_players_accounts(
             )
 
     if cache_file:
-        _save_json(cache_file, cache)
+        await asyncio.to_thread(_save_json, cache_file, cache)
     return hydrated
 
 
-def count_soloq(
-    account: dict,
-    api_key: str,
-    days: int = 1,
-) -> int:
-    """Return the number of ranked SoloQ matches in the last `days` days.
+async def _get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    api_key: str | None = None,
+    timeout: int = 10,
+    retries: int = 3,
+) -> Any:
+    """GET `url` on the shared session and return the decoded JSON body.
 
-    Requires `puuid` in `account` and an `api_key` argument.
+    `api_key` overrides the session's default `X-Riot-Token` header when given.
+    Every call goes through the session's Riot limiter; a 429 pauses it for
+    `Retry-After` and is retried up to `retries` times before raising.
+    """
+    headers = {"X-Riot-Token": api_key} if api_key else None
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    limiter = _riot_limiter_for(session)
+    for attempt in range(1, retries + 1):
+        async with limiter, session.get(url, headers=headers, timeout=client_timeout) as resp:
+            if resp.status != 429 or attempt == retries:
+                resp.raise_for_status()
+                return await resp.json()
+            # The next `async with limiter` waits out the pause.
+            limiter.pause(_jittered(_retry_after_s(resp, attempt)))
+
+
+async def _fetch_match_ids(
+    session: aiohttp.ClientSession,
+    account: dict,
+    api_key: str | None = None,
+    days: int | None = None,
+    count: int = 100,
+    ranked_only: bool = True,
+) -> list[str]:
+    """Return match ids for `account`, newest first.
+
+    With `days=None` there is no time window (used to find the last game played).
+    `ranked_only=False` drops the `type=ranked` filter and returns every queue.
     """
     puuid = account.get("puuid")
     if not puuid:
         raise ValueError("account must include 'puuid'")
 
     region = account.get("region", "europe")
-    now = int(time.time())
-    start_time = now - int(days) * 24 * 3600
+    query = f"start=0&count={count}"
+    if ranked_only:
+        query = f"type=ranked&{query}"
+    if days is not None:
+        now = int(time.time())
+        start_time = now - int(days) * 24 * 3600
+        query = f"startTime={start_time}&endTime={now}&{query}"
+
+    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?{query}"
+    return await _get_json(session, url, api_key=api_key)
+
+
+async def _fetch_match_start_ms(
+    session: aiohttp.ClientSession,
+    region: str,
+    match_id: str,
+    api_key: str | None = None,
+    cache: dict[str, Any] | None = None,
+) -> int:
+    """Return `gameStartTimestamp` (ms since epoch) of a match, 0 if missing.
 
-    url = (
-        f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/"
-        f"{puuid}/ids?startTime={start_time}&endTime={now}&type=ranked&start=0&count=100"
-    )
-    headers = {"X-Riot-Token": api_key}
-    resp = requests.get(url, headers=headers, timeout=10)
-    resp.raise_for_status()
-    match_ids = resp.json()
+    Match details never change, so a `cache` hit (keyed by match id) skips the request.
+    """
+    if cache is not None and cache.get(match_id):
+        return cache[match_id]
+
+    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+    match = await _get_json(session, url, api_key=api_key)
+    ms = match.get("info", {}).get("gameStartTimestamp") or 0
+    if cache is not None and ms:
+        cache[match_id] = ms
+    return ms
+
+
+async def count_soloq(
+    session: aiohttp.ClientSession,
+    account: dict,
+    api_key: str | None = None,
+    days: int = 1,
+) -> int:
+    """Return the number of ranked SoloQ matches in the last `days` days.
+
+    Requires `puuid` in `account`; the Riot key comes from `api_key` or the session headers.
+    """
+    match_ids = await _fetch_match_ids(session, account, api_key=api_key, days=days)
     return len(match_ids)
 
-def get_current_elo(account: dict, api_key: str) -> str:
+async def get_current_elo(
+    session: aiohttp.ClientSession,
+    account: dict,
+    api_key: str | None = None,
+    cache: dict[str, Any] | None = None,
+) -> str:
     """Return the current ranked tier/division for the given account.
 
-    Requires `puuid` in `account` and an `api_key` argument.
+    Requires `puuid` in `account`; the Riot key comes from `api_key` or the session headers.
+    If `cache` is given, the league entry is looked up/stored under `"{puuid}:{YYYYMMDD}"`
+    so reruns on the same day don't hit the API again.
     """
     puuid = account.get("puuid")
     if not puuid:
         raise ValueError("account must include 'puuid'")
 
+    cache_key = f"{puuid}:{time.strftime('%Y%m%d')}"
+    cached = cache.get(cache_key) if cache is not None else None
+    if isinstance(cached, dict):
+        return _format_elo(cached)
+
     region = account.get("region", "europe")
     platform_map = {"europe": "euw1", "americas": "na1", "asia": "kr"}
     platform = platform_map.get(region, "euw1")
 
-    headers = {"X-Riot-Token": api_key}
-
     # Get summoner id by puuid
     url = f"https://{platform}.api.riotgames.com/lol/league/v4/entries/by-puuid/{puuid}"
-    resp = requests.get(url, headers=headers, timeout=10)
-    resp.raise_for_status()
-    print(resp.json())
-    entries = resp.json()
+    entries = await _get_json(session, url, api_key=api_key)
 
+    solo = {}  # stays empty when unranked
     for entry in entries:
         if entry.get("queueType") == "RANKED_SOLO_5x5":
-            tier = entry.get("tier")
-            rank = entry.get("rank")
-            lp = entry.get("leaguePoints")
-            return f"{tier} {rank} - {lp} LP"
-    return "Unranked"
+            solo = {"tier": entry.get("tier"), "rank": entry.get("rank"), "lp": entry.get("leaguePoints")}
+            break
+    if cache is not None:
+        cache[cache_key] = solo
+    return _format_elo(solo)
+
+
+def _format_elo(solo: dict[str, Any]) -> str:
+    if not solo.get("tier"):
+        return "Unranked"
+    return f"{solo['tier']} {solo['rank']} - {solo['lp']} LP"
 
 import re
+from functools import lru_cache
 
 TIERS = [
     "IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM",
@@ -225,33 +497,43 @@ TIERS = [
 TIER_RANK = {t: i for i, t in enumerate(TIERS)}
 DIV_MAP = {"V": 0, "IV": 1, "III": 2, "II": 3, "I": 4}
 
+# Compiled once; `_parse_elo` runs for every account elo in a report.
+# LP accepts both "(45 LP)" and the "- 45 LP" produced by `get_current_elo`.
+_LP_RE = re.compile(r"(\d+)\s*LP\b")
+_DIV_RE = re.compile(r"\b(I{1,3}|IV|V)\b")
+# Whole words only, so "MASTER" never matches inside "GRANDMASTER" (nor "GOLD" inside "GOLDEN").
+_TIER_RE = re.compile(r"\b(" + "|".join(sorted(TIERS, key=len, reverse=True)) + r")\b")
+
 
 def _parse_elo(s: str) -> tuple[int, int, int]:
     """Return (tier_rank, division_value, lp). Unranked -> (-1,-1,-1)."""
     if not s:
         return -1, -1, -1
-    su = s.upper().strip()
+    # normalize before the cache so "diamond ii" and "DIAMOND II " share one entry
+    return _parse_elo_normalized(s.upper().strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_elo_normalized(su: str) -> tuple[int, int, int]:
+    """`_parse_elo` on an already upper-cased, stripped string (memoized, pure)."""
     if "UNRANKED" in su:
         return -1, -1, -1
 
     # lp
-    m = re.search(r"\((\d+)\s*LP\)", su)
+    m = _LP_RE.search(su)
     lp = int(m.group(1)) if m else 0
 
     # tier
-    tier_rank = -1
-    for t in TIERS:
-        if t in su:
-            tier_rank = TIER_RANK[t]
-            break
-    if tier_rank == -1:
+    mtier = _TIER_RE.search(su)
+    if not mtier:
         return -1, -1, -1
+    tier_rank = TIER_RANK[mtier.group(1)]
 
     # divisions: Master+ don't have divisions so treat them above Diamond I
     if tier_rank >= TIER_RANK["MASTER"]:
         division_value = 5
     else:
-        mdiv = re.search(r"\b(I|II|III|IV|V)\b", su)
+        mdiv = _DIV_RE.search(su)
         division_value = DIV_MAP.get(mdiv.group(1), 0) if mdiv else 0
 
     return tier_rank, division_value, lp
@@ -270,8 +552,13 @@ def max_elo(acc_elos: list[str]) -> str | None:
     best = max(parsed, key=lambda x: (x[0][0], x[0][1], x[0][2]))
     return best[1]
 
-from datetime import datetime
-import pytz
+from datetime import datetime, tzinfo
+from itertools import repeat
+from zoneinfo import ZoneInfo
+
+# Resolved once instead of on every `_format_ts_ms` call.
+_PARIS_TZ = ZoneInfo("Europe/Paris")
+_LAST_GAME_FMT = "%d %b - %H:%M"
 
 def format_players_report(rows: list[dict]) -> str:
     """
@@ -281,72 +568,163 @@ def format_players_report(rows: list[dict]) -> str:
     """
     headers = ["Player", "Games 24 Hours", "Games 7 days", "Last Game", "Current Elo", "Main Account", "Reha happy"]
     cols = ["Player", "Games24", "Games7", "LastGame", "Elo", "Main", "Emoji"]
+    aligns = ["L", "R", "R", "L", "L", "L", "L"]
+
+    # column-oriented: stringify every cell once, then pad whole columns with C-level str methods
+    cols_str = [[str(v) if (v := r.get(c, "")) is not None else "" for r in rows] for c in cols]
 
     # compute column widths
-    widths = []
-    for h, c in zip(headers, cols):
-        maxw = len(h)
-        for r in rows:
-            v = str(r.get(c, "")) if r.get(c, "") is not None else ""
-            maxw = max(maxw, len(v))
-        widths.append(maxw)
+    widths = [max(len(h), max(map(len, col), default=0)) for h, col in zip(headers, cols_str)]
 
     # format header
-    header_line = "  ".join(h.ljust(w) for h, w in zip(headers, widths))
+    header_line = "  ".join(map(str.ljust, headers, widths))
     sep_line = "  ".join("-" * w for w in widths)
 
     # format rows
-    row_lines = []
-    for r in rows:
-        vals = [
-            str(r.get("Player", "")).ljust(widths[0]),
-            str(r.get("Games24", "")).rjust(widths[1]),
-            str(r.get("Games7", "")).rjust(widths[2]),
-            str(r.get("LastGame", "")).ljust(widths[3]),
-            str(r.get("Elo", "")).ljust(widths[4]),
-            str(r.get("Main", "")).ljust(widths[5]),
-            str(r.get("Emoji", "")).ljust(widths[6]),
-        ]
-        row_lines.append("  ".join(vals))
+    padded_cols = [
+        list(map(str.ljust if a == "L" else str.rjust, col, repeat(w)))
+        for col, w, a in zip(cols_str, widths, aligns)
+    ]
+    row_lines = list(map("  ".join, zip(*padded_cols)))
 
     lines = [header_line, sep_line] + row_lines
     return "\n".join(lines)
 
-def _format_ts_ms(ms: int, tz_name: str = "Europe/Paris") -> str:
+def _format_ts_ms(ms: int, tz: tzinfo = _PARIS_TZ) -> str:
     if not ms:
         return "No games"
-    tz = pytz.timezone(tz_name)
-    dt = datetime.fromtimestamp(ms / 1000, tz)
-    return dt.strftime("%d %b - %H:%M")
+    return datetime.fromtimestamp(ms // 1000, tz).strftime(_LAST_GAME_FMT)
 
-def get_last_game_time(account: dict, api_key: str) -> str:
+async def get_last_game_time(
+    session: aiohttp.ClientSession,
+    account: dict,
+    api_key: str | None = None,
+    match_cache: dict[str, Any] | None = None,
+) -> str:
     puuid = account.get("puuid")
     region = account.get("region", "europe")
     if not puuid:
         return "No games"
-    url_ids = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count=1"
-    resp = requests.get(url_ids, headers={"X-Riot-Token": api_key}, timeout=10)
-    resp.raise_for_status()
-    ids = resp.json()
+    ids = await _fetch_match_ids(session, account, api_key=api_key, count=1, ranked_only=False)
     if not ids:
         return "No games"
-    match_id = ids[0]
-    url_match = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-    resp = requests.get(url_match, headers={"X-Riot-Token": api_key}, timeout=10)
-    resp.raise_for_status()
-    match = resp.json()
-    # match['info']['gameStartTimestamp'] is ms since epoch
-    ms = match.get("info", {}).get("gameStartTimestamp")
+    ms = await _fetch_match_start_ms(session, region, ids[0], api_key=api_key, cache=match_cache)
     return _format_ts_ms(ms)
 
-def build_player_rows(players_accounts: dict, global_api_key: str) -> list[dict]:
+async def build_player_rows(
+    session: aiohttp.ClientSession,
+    players_accounts: dict,
+    global_api_key: str | None = None,
+    elo_cache_path: str | None = "data/riot_elo_cache.json",
+    match_cache_path: str | None = "data/riot_match_cache.json",
+) -> list[dict]:
     """
+    session: shared aiohttp session used for every Riot API call
     players_accounts: structure like PLAYERS_ACCOUNTS
     global_api_key: recommended key for Riot API (you may use account['api_key'] if per-account)
+    elo_cache_path / match_cache_path: on-disk caches (set to None to disable)
     Returns rows list for format_players_report().
+
+    All Riot calls for all accounts are issued concurrently; a failing call only
+    drops its own value from the report.
+
+    "LastGame" is the newest *ranked* game, like the Games24/Games7 counts; use
+    `get_last_game_time()` for the newest game of any queue.
     """
+    elo_cache_file = Path(elo_cache_path) if elo_cache_path else None
+    match_cache_file = Path(match_cache_path) if match_cache_path else None
+    # Elo entries are only valid for the day they were fetched: drop older ones.
+    today = time.strftime("%Y%m%d")
+    elo_cache = {
+        k: v for k, v in (await asyncio.to_thread(_load_json, elo_cache_file) if elo_cache_file else {}).items()
+        if k.endswith(f":{today}")
+    }
+    match_cache = await asyncio.to_thread(_load_json, match_cache_file) if match_cache_file else {}
+
+    def cached_games_24(ids: list[str]) -> int | None:
+        """Count games of the last 24h from cached start times, None if any is unknown.
+
+        `ids` is newest first, so the scan stops at the first game older than 24h.
+        """
+        cutoff_ms = (int(time.time()) - 24 * 3600) * 1000
+        count = 0
+        for match_id in ids:
+            ms = match_cache.get(match_id)
+            if not ms:
+                return None
+            if ms < cutoff_ms:
+                break
+            count += 1
+        return count
+
+    async def recent_games(acc: dict, api_key: str | None) -> tuple[int, int, int]:
+        """Return (ranked games in the last 24h, in the last 7 days, start ms of the newest game).
+
+        The newest id of the 7-day list is the last game, so no separate lookup
+        is needed unless the account was idle all week. The 24h count comes from
+        the same list when the match cache knows the start times; otherwise it is
+        requested alongside the newest-match lookup rather than after it.
+        """
+        ids = await _fetch_match_ids(session, acc, api_key=api_key, days=7)
+
+        async def latest_start_ms() -> int:
+            # A failed last-game lookup must not cost the account its game counts.
+            try:
+                # Ranked-only on purpose, so idle accounts use the same rule as the 7-day list.
+                latest = ids[:1] or await _fetch_match_ids(
+                    session, acc, api_key=api_key, count=1, ranked_only=True
+                )
+                if not latest:
+                    return 0
+                return await _fetch_match_start_ms(
+                    session, acc.get("region", "europe"), latest[0], api_key=api_key, cache=match_cache
+                )
+            except Exception:
+                return 0
+
+        async def requested_games_24() -> int:
+            try:
+                return await count_soloq(session, acc, api_key=api_key, days=1)
+            except Exception:
+                return 0
+
+        # ids[0] is cached by latest_start_ms(); any other unknown id means the
+        # cache can't answer, so the 24h request runs concurrently with it.
+        if all(match_id in match_cache for match_id in ids[1:]):
+            ms = await latest_start_ms()
+            games_24 = cached_games_24(ids)
+            if games_24 is None:  # newest-match lookup failed
+                games_24 = await requested_games_24()
+        else:
+            ms, games_24 = await asyncio.gather(latest_start_ms(), requested_games_24())
+        return games_24, len(ids), ms
+
+    async def process_account(acc: dict) -> list:
+        api_key = global_api_key if global_api_key else acc.get("api_key")
+        return await asyncio.gather(
+            recent_games(acc, api_key),
+            get_current_elo(session, acc, api_key=api_key, cache=elo_cache),
+            return_exceptions=True,
+        )
+
+    players = list(players_accounts.items())
+    results = await asyncio.gather(
+        *(asyncio.gather(*(process_account(acc) for acc in accounts)) for _, accounts in players)
+    )
+    # File I/O off the event loop so the bot keeps answering while caches are written.
+    if elo_cache_file:
+        await asyncio.to_thread(_save_json, elo_cache_file, elo_cache)
+    if match_cache_file:
+        await asyncio.to_thread(_save_json, match_cache_file, match_cache)
+
+    # parsing/formatting tail runs in a worker thread so the event loop stays free
+    return await asyncio.to_thread(_finalize_rows, players, results)
+
+
+def _finalize_rows(players: list[tuple[str, list[dict]]], results: list[list[list]]) -> list[dict]:
+    """Reduce per-account results from `build_player_rows` into one report row per player."""
     rows = []
-    for player, accounts in players_accounts.items():
+    for (player, accounts), acc_results in zip(players, results):
         games_24 = 0
         games_7 = 0
         last_game_ts_ms = 0
@@ -354,40 +732,17 @@ def build_player_rows(players_accounts: dict, global_api_key: str) -> list[dict]
         main_account = accounts[0].get("account_name", "")
         emoji = "💀"  # or map per-player
 
-        for acc in accounts:
-            api_key = global_api_key if global_api_key else acc.get("api_key")
-            # counts
-            try:
-                games_24 += count_soloq(acc, api_key=api_key, days=1)
-                games_7 += count_soloq(acc, api_key=api_key, days=7)
-            except Exception:
-                pass
-            # last game: prefer newest timestamp
-            try:
-                # get last game id and then timestamp (use helper)
-                puuid = acc.get("puuid")
-                if puuid:
-                    url_ids = f"https://{acc.get('region','europe')}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count=1"
-                    r = requests.get(url_ids, headers={"X-Riot-Token": api_key}, timeout=10)
-                    r.raise_for_status()
-                    ids = r.json()
-                    if ids:
-                        mid = ids[0]
-                        r2 = requests.get(f"https://{acc.get('region','europe')}.api.riotgames.com/lol/match/v5/matches/{mid}", headers={"X-Riot-Token": api_key}, timeout=10)
-                        r2.raise_for_status()
-                        ms = r2.json().get("info", {}).get("gameStartTimestamp", 0)
-                        if ms and ms > last_game_ts_ms:
-                            last_game_ts_ms = ms
-            except Exception:
-                pass
-
+        for recent, elo in acc_results:
+            # counts and last game: prefer newest timestamp
+            if not isinstance(recent, BaseException):
+                g24, g7, ms = recent
+                games_24 += g24
+                games_7 += g7
+                if ms > last_game_ts_ms:
+                    last_game_ts_ms = ms
             # elo
-            try:
-                elo = get_current_elo(acc, api_key=api_key)
-                if elo:
-                    acc_elos.append(elo)
-            except Exception:
-                pass
+            if not isinstance(elo, BaseException) and elo:
+                acc_elos.append(elo)
 
         last_game_str = _format_ts_ms(last_game_ts_ms) if last_game_ts_ms else "No games"
         best_elo = max_elo(acc_elos) if acc_elos else "Unranked"
@@ -413,9 +768,6 @@ def build_players_embed(rows: list[dict], title: str = "SoloQ Report"):
     # import discord here to keep module lightweight if not used
     import discord
 
-    def _col_join(key: str) -> str:
-        return "\n".join(str(r.get(key, "")) for r in rows) or "-"
-
     def _truncate(s: str, limit: int = 1000) -> str:
         if len(s) <= limit:
             return s
@@ -423,14 +775,15 @@ def build_players_embed(rows: list[dict], title: str = "SoloQ Report"):
 
     embed = discord.Embed(title=title)
 
-    # Prepare column text
-    col_player = _truncate(_col_join("Player"))
-    col_24 = _truncate(_col_join("Games24"))
-    col_7 = _truncate(_col_join("Games7"))
-    col_last = _truncate(_col_join("LastGame"))
-    col_elo = _truncate(_col_join("Elo"))
-    col_main = _truncate(_col_join("Main"))
-    col_emoji = _truncate(_col_join("Emoji"))
+    # Prepare column text: one pass over rows fills every column
+    keys = ("Player", "Games24", "Games7", "LastGame", "Elo", "Main", "Emoji")
+    cols_data: dict[str, list[str]] = {k: [] for k in keys}
+    for r in rows:
+        for k, lst in cols_data.items():
+            lst.append(str(r.get(k, "")))
+    col_player, col_24, col_7, col_last, col_elo, col_main, col_emoji = (
+        _truncate("\n".join(cols_data[k]) or "-") for k in keys
+    )
 
     # Add fields in two rows of three inline fields to avoid excessive wrapping:
     # Row 1: Player | 24h | 7d